@@ -14,13 +14,20 @@ Example:
         public/data/grocery-data.json
 """
 
-import json
 import re
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import BinaryIO, Callable, Dict, Iterator, List, Union
 
+import ahocorasick
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 
 
 class StatCanJSONProcessor:
@@ -55,6 +62,47 @@ class StatCanJSONProcessor:
         r"\bunit\b"
     )
 
+    # Raw CSV columns used by transform, with their Arrow parse types
+    CSV_COLUMN_TYPES = {
+        "REF_DATE": pa.string(),
+        "GEO": pa.string(),
+        "Products": pa.string(),
+        "VALUE": pa.float64(),
+    }
+    # Bytes of CSV read and transformed per chunk (~250k StatCan rows)
+    CSV_BLOCK_SIZE = 32 << 20
+
+    # Standard unit for each unit spelling matched by the expressions above
+    UNIT_KINDS = {
+        "kilogram": "kg", "kilograms": "kg", "kg": "kg",
+        "gram": "kg", "grams": "kg", "g": "kg",
+        "litre": "L", "litres": "L", "l": "L",
+        "millilitre": "L", "millilitres": "L", "ml": "L",
+    }
+    # Units whose package sizes are scaled down by 1000 (g → kg, ml → L)
+    SMALL_UNITS = ["gram", "grams", "g", "millilitre", "millilitres", "ml"]
+
+    # Low-cardinality string columns stored as pandas categoricals
+    CATEGORY_COLUMNS = [
+        "product_name", "product_category", "product_unit",
+        "location", "city", "province",
+    ]
+
+    # Fields of the output "products" and "locations" entries
+    PRODUCT_COLUMNS = ["product_name", "product_category", "product_unit"]
+    LOCATION_COLUMNS = ["location", "city", "province"]
+    # Fields of each record in the output "prices" array
+    PRICE_COLUMNS = [
+        "date", "product_name", "product_category", "price_per_unit",
+        "product_unit", "location", "city", "province",
+    ]
+    # Rows encoded per batch when writing price records
+    PRICE_CHUNK_SIZE = 50_000
+
+    # Distinct product names above which categories are inferred in a
+    # process pool
+    PARALLEL_MIN_NAMES = 20_000
+
     # Category keywords for classification
     # Note: Order matters - more specific categories should come first
     CATEGORY_KEYWORDS = {
@@ -115,70 +163,128 @@ class StatCanJSONProcessor:
 
     def __init__(self) -> None:
         """Initialize the processor with regex patterns."""
-        self.per_unit_regex = re.compile(
-            self.PER_UNIT_EXPR, re.IGNORECASE
-        )
-        self.package_size_regex = re.compile(
-            self.PACKAGE_SIZE_EXPR, re.IGNORECASE
-        )
+        self.per_regex = re.compile(self.PER_EXPR, re.IGNORECASE)
+        # Weights, quantities, units, parenthetical content and special
+        # characters are removed in one sweep; no alternative can start
+        # where another one does, so this matches removing them in turn
         self.clean_regex = re.compile(
             (
                 f"({self.PACKAGE_SIZE_EXPR})|"
                 f"({self.QUANTITY_EXPR})|"
-                f"({self.UNIT_GARBAGE})"
+                f"({self.UNIT_GARBAGE})|"
+                r"(\(.*?\))|"
+                r"([^\w\s])"
             ),
             re.IGNORECASE,
         )
+        self.whitespace_regex = re.compile(r"\s{2,}")
+        # Keyword automaton; each keyword carries the priority of its
+        # category (CATEGORY_KEYWORDS order) so the first category wins
+        self.category_automaton = ahocorasick.Automaton()
+        for priority, (category, keywords) in enumerate(
+            self.CATEGORY_KEYWORDS.items()
+        ):
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if not self.category_automaton.exists(keyword):
+                    self.category_automaton.add_word(
+                        keyword, (priority, category, len(keyword))
+                    )
+        self.category_automaton.make_automaton()
 
     def process(self, input_file: str, output_file: str) -> None:
         """Process CSV file and output JSON.
 
+        The CSV is read and transformed in blocks, so memory use depends on
+        the block size rather than the size of the input file.
+
         Args:
             input_file: Path to input CSV file
             output_file: Path to output JSON file
 
         Raises:
             FileNotFoundError: If input file doesn't exist
-            pd.errors.EmptyDataError: If CSV is empty
+            pyarrow.ArrowInvalid: If CSV is empty or malformed
         """
-        print(f"Reading data from {input_file}...")
-        df = pd.read_csv(input_file, low_memory=False)
-        print(f"Loaded {len(df)} rows")
+        print(f"Reading and transforming data from {input_file}...")
+        total_rows = 0
+        summaries = []
+
+        # Price rows are staged in a temporary file while chunks stream
+        # through, since the header written before them needs every chunk
+        with tempfile.TemporaryFile() as prices:
+            for chunk in self.read_chunks(input_file):
+                total_rows += len(chunk)
+                df_transformed = self.transform(chunk)
+                for row in self._encode_price_rows(df_transformed):
+                    prices.write(b",\n    " if prices.tell() else b"\n    ")
+                    prices.write(row)
+                summaries.append(self.summarize(df_transformed))
+            print(f"Loaded {total_rows} rows")
+
+            # Convert to JSON-friendly format
+            print("\nConverting to JSON format...")
+            output_data = self.create_json_structure(
+                pd.concat(summaries, ignore_index=True)
+            )
+
+            # Write to JSON file
+            print(f"\nWriting results to {output_file}...")
+            prices.seek(0)
+            self.write_json(output_data, prices, output_file)
+
+        total_records = output_data["metadata"]["total_records"]
+        print(f"Done! Processed {total_records} rows")
 
-        print("\nTransforming data...")
-        df_transformed = self.transform(df)
-
-        # Convert to JSON-friendly format
-        print("\nConverting to JSON format...")
-        output_data = self.create_json_structure(df_transformed)
-
-        # Write to JSON file
-        print(f"\nWriting results to {output_file}...")
-        output_path = Path(output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Print summary
+        self.print_summary(output_data)
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+    def read_chunks(self, input_file: str) -> Iterator[pd.DataFrame]:
+        """Read the columns used by transform from a CSV file in blocks.
 
-        print(f"Done! Processed {len(df_transformed)} rows")
+        Args:
+            input_file: Path to input CSV file
 
-        # Print summary
-        self.print_summary(df_transformed, output_data)
+        Yields:
+            Raw DataFrames of consecutive CSV rows, with Arrow-backed
+            string columns
+        """
+        reader = pa_csv.open_csv(
+            input_file,
+            read_options=pa_csv.ReadOptions(block_size=self.CSV_BLOCK_SIZE),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=list(self.CSV_COLUMN_TYPES),
+                column_types=self.CSV_COLUMN_TYPES,
+            ),
+        )
+        types_mapper = {pa.string(): pd.StringDtype("pyarrow")}.get
+        empty = True
+        for batch in reader:
+            empty = False
+            yield batch.to_pandas(types_mapper=types_mapper)
+
+        # A header-only CSV still yields one (empty) chunk
+        if empty:
+            yield reader.schema.empty_table().to_pandas(
+                types_mapper=types_mapper
+            )
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Transform raw CSV data into clean, structured format.
 
         Applies cleaning operations in the following order:
         1. Rename columns to standardized names
-        2. Format dates to YYYY-MM-DD format
-        3. Detect per-unit pricing vs package pricing
-        4. Extract weight/unit from per-unit or package descriptions
-        5. Clean product names
-        6. Infer product categories
-        7. Normalize prices (divide package price by weight when needed)
-        8. Format location strings
-        9. Parse locations into city and province
-        10. Filter out invalid prices
+        2. Filter out missing, zero, or negative prices
+        3. Format dates to YYYY-MM-DD format
+        4. Detect per-unit pricing vs package pricing
+        5. Extract weight/unit from per-unit or package descriptions
+        6. Clean product names
+        7. Infer product categories
+        8. Normalize prices (divide package price by weight when needed)
+        9. Format location strings
+        10. Parse locations into city and province
+        11. Filter out prices that normalize to zero
+        12. Convert repeated string columns to categoricals
 
         Args:
             df: Raw DataFrame from CSV extraction
@@ -196,108 +302,152 @@ class StatCanJSONProcessor:
             }
         )
 
-        # Format dates (YYYY-MM to YYYY-MM-01 for consistency)
-        df["date"] = df["date"].apply(self._format_date)
-
-        # Detect if price is already per-unit (contains "per X")
-        # Note: Using str.contains without capturing groups to avoid warning
-        df["is_per_unit"] = df["product_raw"].str.contains(
-            self.PER_UNIT_EXPR, regex=True, case=False, na=False
-        )
+        # Drop missing and non-positive prices up front so no string work
+        # is spent on rows that would be filtered out anyway
+        df = df[
+            df["product_price"].notna() & (df["product_price"] > 0)
+        ].reset_index(drop=True)
 
-        # Extract weight and unit
-        df[["product_weight", "product_unit"]] = df[
-            "product_raw"
-        ].apply(lambda x: pd.Series(self._extract_weight_and_unit(x)))
+        # Dates, descriptions, names and locations repeat across every
+        # product, month and location, so the string work below runs once
+        # per distinct value
 
-        # Clean product names
-        df["product_name"] = df["product_raw"].apply(
-            self._clean_product_name
-        )
+        # Format dates (YYYY-MM to YYYY-MM-01 for consistency)
+        df["date"] = self._map_unique(df["date"], self._format_date)
 
-        # Infer categories
-        df["product_category"] = df["product_name"].apply(
-            self._infer_category
-        )
+        # Detect per-unit pricing, extract weight and unit, clean names and
+        # infer categories, all of which depend only on the description
+        products = self._map_unique(df["product_raw"], self._parse_products)
+        df[list(products.columns)] = products
 
         # Normalize prices
         # If "per X" is in description, price is already per unit
         # Otherwise, divide by weight (e.g., "500 grams" → divide by 0.5)
-        df["price_per_unit"] = df.apply(
-            lambda row: (
-                row["product_price"]
-                if row["is_per_unit"]
-                else (
-                    row["product_price"] / row["product_weight"]
-                    if row["product_weight"] > 0
-                    else row["product_price"]
-                )
-            ),
-            axis=1,
-        ).round(2)
+        # Work on plain float64/bool NumPy arrays so the arithmetic below
+        # never falls back to object arrays
+        price = df["product_price"].to_numpy(dtype=np.float64)
+        weight = df["product_weight"].to_numpy(dtype=np.float64)
+        is_per_unit = df["is_per_unit"].to_numpy(dtype=bool)
+        # Dividing by 1.0 leaves per-unit and weightless prices as-is, so a
+        # single divide covers every case
+        weight_effective = np.where(is_per_unit | (weight <= 0), 1.0, weight)
+        df["price_per_unit"] = (price / weight_effective).round(2)
 
         # Normalize locations
-        df["location"] = df["location"].str.strip().str.title()
+        df["location"] = self._map_unique(
+            df["location"], lambda location: location.str.strip().str.title()
+        )
 
         # Parse location into city and province
-        df[["city", "province"]] = df["location"].apply(
-            lambda x: pd.Series(self._parse_location(x))
+        df[["city", "province"]] = self._map_unique(
+            df["location"], self._parse_location
         )
 
-        # Remove rows with invalid prices (zero or negative)
+        # Remove rows whose normalized price rounds to zero
         df = df[df["price_per_unit"] > 0]
 
+        # Store repeated strings as categoricals so uniques and counts work
+        # on small integer codes; categories keep first-appearance order so
+        # ties in value_counts come out as they did for plain strings
+        df = df.copy()
+        for column in self.CATEGORY_COLUMNS:
+            df[column] = pd.Categorical(
+                df[column], categories=df[column].unique()
+            )
+
         return df
 
-    def create_json_structure(self, df: pd.DataFrame) -> Dict:
+    def _map_unique(
+        self,
+        values: pd.Series,
+        func: Callable[[pd.Series], Union[pd.Series, pd.DataFrame]],
+    ) -> Union[pd.Series, pd.DataFrame]:
+        """Apply a column-wise function to distinct values only.
+
+        Args:
+            values: Series with heavily repeated values
+            func: Function mapping a Series to a Series or DataFrame with
+                the same index
+
+        Returns:
+            Result of func for every row of values, aligned to its index
+        """
+        unique = values.drop_duplicates()
+        result = func(unique)
+        result.index = pd.Index(unique)
+        return result.reindex(values).set_axis(values.index)
+
+    def summarize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Summarize a transformed DataFrame by product and location.
+
+        Summaries of consecutive chunks can be concatenated and passed to
+        create_json_structure as if the chunks had been one DataFrame.
+
+        Args:
+            df: Transformed DataFrame
+
+        Returns:
+            DataFrame with one row per product and location, in order of
+            first appearance, with record counts and date bounds
+        """
+        return (
+            df.groupby(
+                self.PRODUCT_COLUMNS + self.LOCATION_COLUMNS,
+                sort=False,
+                observed=True,
+            )
+            .agg(
+                count=("date", "size"),
+                date_min=("date", "min"),
+                date_max=("date", "max"),
+            )
+            .reset_index()
+        )
+
+    def create_json_structure(self, summary: pd.DataFrame) -> Dict:
         """Create a structured JSON output with metadata and data.
 
+        Price records are not included; process streams them into the
+        "prices" array separately.
+
+        Args:
+            summary: Concatenated output of summarize
+
         Returns:
-            Dictionary with metadata, categories, locations, products,
-            and price data
+            Dictionary with metadata, categories, locations, and products
         """
         # Get unique products with their info
-        products = df[
-            ["product_name", "product_category", "product_unit"]
-        ].drop_duplicates()
+        products = summary[self.PRODUCT_COLUMNS].drop_duplicates()
         products_list = products.to_dict("records")
 
         # Get unique locations
-        locations = df[["location", "city", "province"]].drop_duplicates()
+        locations = summary[self.LOCATION_COLUMNS].drop_duplicates()
         locations_list = locations.to_dict("records")
 
-        # Get unique categories with counts
-        category_counts = df["product_category"].value_counts().to_dict()
+        # Get unique categories with counts, most frequent first and ties
+        # in order of first appearance
+        category_counts = (
+            summary.groupby("product_category", sort=False)["count"]
+            .sum()
+            .sort_values(ascending=False, kind="stable")
+            .to_dict()
+        )
         categories = [
             {"name": cat, "count": count}
             for cat, count in category_counts.items()
         ]
 
-        # Price records (main data)
-        price_records = df[
-            [
-                "date",
-                "product_name",
-                "product_category",
-                "price_per_unit",
-                "product_unit",
-                "location",
-                "city",
-                "province",
-            ]
-        ].to_dict("records")
-
         # Date range
         date_range = {
-            "min": df["date"].min(),
-            "max": df["date"].max(),
+            "min": summary["date_min"].min(),
+            "max": summary["date_max"].max(),
         }
 
         return {
             "metadata": {
                 "source": "Statistics Canada",
                 "processed_date": pd.Timestamp.now().strftime("%Y-%m-%d"),
-                "total_records": len(price_records),
+                "total_records": int(summary["count"].sum()),
                 "date_range": date_range,
                 "total_products": len(products_list),
                 "total_locations": len(locations_list),
@@ -306,81 +456,158 @@ class StatCanJSONProcessor:
             "categories": categories,
             "locations": locations_list,
             "products": products_list,
-            "prices": price_records,
         }
 
-    def _format_date(self, date_str: str) -> str:
-        """Format date string to YYYY-MM-DD.
+    def write_json(
+        self, output_data: Dict, prices: BinaryIO, output_file: str
+    ) -> None:
+        """Write the JSON structure and pre-encoded price records to a file.
+
+        Args:
+            output_data: JSON structure from create_json_structure
+            prices: Readable file of comma-separated, encoded price rows
+                as written by process
+            output_file: Path to output JSON file
+        """
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        header = orjson.dumps(
+            output_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+        with open(output_path, "wb") as f:
+            # Drop the closing "\n}" so the prices array can be appended
+            f.write(header[:-2])
+            f.write(b',\n  "prices": [')
+            shutil.copyfileobj(prices, f)
+            f.write(b"\n  ]\n}")
+
+    def _encode_price_rows(self, df: pd.DataFrame) -> Iterator[bytes]:
+        """Encode price records of df as JSON objects, one at a time.
+
+        Args:
+            df: Transformed DataFrame
+
+        Yields:
+            One JSON-encoded price record per row
+        """
+        for start in range(0, len(df), self.PRICE_CHUNK_SIZE):
+            chunk = df.iloc[start:start + self.PRICE_CHUNK_SIZE]
+            columns = [chunk[column].tolist() for column in self.PRICE_COLUMNS]
+            for values in zip(*columns):
+                yield orjson.dumps(dict(zip(self.PRICE_COLUMNS, values)))
+
+    def _parse_products(self, raw: pd.Series) -> pd.DataFrame:
+        """Derive product fields from product descriptions.
+
+        Args:
+            raw: Series of product descriptions
+
+        Returns:
+            DataFrame with is_per_unit, product_weight, product_unit,
+            product_name and product_category columns
+        """
+        # Detect per-unit pricing and extract weight and unit
+        products = self._extract_weight_and_unit(raw)
+
+        # Clean product names
+        products["product_name"] = self._clean_product_name(raw)
+
+        # Infer categories; only very large name sets are worth the cost
+        # of starting worker processes
+        names = products["product_name"]
+        if len(names) >= self.PARALLEL_MIN_NAMES:
+            with ProcessPoolExecutor() as executor:
+                products["product_category"] = list(
+                    executor.map(self._infer_category, names, chunksize=1024)
+                )
+        else:
+            products["product_category"] = names.map(self._infer_category)
+
+        return products
+
+    def _format_date(self, date: pd.Series) -> pd.Series:
+        """Format date strings to YYYY-MM-DD.
 
         Converts "YYYY-MM" format to "YYYY-MM-01".
         If date is already in full format or invalid, returns as-is.
 
         Args:
-            date_str: Date string from CSV (typically YYYY-MM format)
+            date: Series of date strings from CSV (typically YYYY-MM format)
 
         Returns:
-            Formatted date string (YYYY-MM-DD)
+            Series of formatted date strings (YYYY-MM-DD)
         """
-        date_str = str(date_str).strip()
-        if re.match(r"^\d{4}-\d{2}$", date_str):
-            return f"{date_str}-01"
-        return date_str
+        date = date.astype(str).str.strip()
+        is_month = date.str.fullmatch(r"\d{4}-\d{2}")
+        return date.where(~is_month, date + "-01")
 
-    def _extract_weight_and_unit(self, text: str) -> Tuple[float, str]:
-        """Extract weight value and unit from product description.
+    def _extract_weight_and_unit(self, text: pd.Series) -> pd.DataFrame:
+        """Extract weight value and unit from product descriptions.
 
         Handles two cases:
         1. "per kilogram" → weight=1.0, unit="kg" (already per-unit)
         2. "500 grams" → weight=0.5, unit="kg" (package size)
 
-        Normalizes all weights to standard units (kg, L).
+        Normalizes all weights to standard units (kg, L). Descriptions with
+        neither are treated as a single unit (each).
 
         Args:
-            text: Product description text to parse
+            text: Series of product description text to parse
 
         Returns:
-            Tuple of (weight_value, unit) where unit is kg, L, or unit
+            DataFrame with is_per_unit, product_weight and product_unit
+            columns, where unit is kg, L, or unit
         """
-        # Check if "per X" pricing (already per-unit)
-        per_match = self.per_unit_regex.search(text)
-        if per_match:
-            unit_text = per_match.group(1).lower()
-            # Extract the base unit
-            if unit_text in ("kilogram", "kg"):
-                return 1.0, "kg"
-            elif unit_text in ("gram", "g"):
-                return 1.0, "kg"  # Per gram pricing, rare but possible
-            elif unit_text in ("litre", "l"):
-                return 1.0, "L"
-            elif unit_text in ("ml", "millilitre"):
-                return 1.0, "L"  # Per ml pricing, rare but possible
-            else:
-                return 1.0, "kg"
-
-        # Check for package size (e.g., "500 grams", "1 kilogram")
-        package_match = self.package_size_regex.search(text)
-        if package_match:
-            value = float(package_match.group(1))
-            unit = package_match.group(3).lower()
-
-            # Convert grams to kg
-            if unit == "g" or (
-                unit.startswith("gram") and not unit.startswith("kilogram")
-            ):
-                return value / 1000, "kg"
-            # Convert ml to L
-            if "ml" in unit or unit.startswith("millilitre"):
-                return value / 1000, "L"
-            if unit == "l" or unit.startswith("litre"):
-                return value, "L"
-            # kg or kilogram
-            return value, "kg"
+        # "per X" pricing (already per-unit)
+        per_unit = text.str.extract(
+            self.PER_UNIT_EXPR, flags=re.IGNORECASE, expand=True
+        )[0].str.lower()
+        has_per_unit = per_unit.notna().to_numpy()
+
+        # Package size (e.g., "500 grams", "1 kilogram")
+        package = text.str.extract(
+            self.PACKAGE_SIZE_EXPR, flags=re.IGNORECASE, expand=True
+        )
+        package_value = package[0].astype(float).to_numpy()
+        package_unit = package[2].str.lower()
+        has_package = package_unit.notna().to_numpy()
+
+        # Convert grams to kg and ml to L
+        package_weight = np.where(
+            package_unit.isin(self.SMALL_UNITS).to_numpy(),
+            package_value / 1000,
+            package_value,
+        )
 
-        # No weight/unit found, treat as single unit (each)
-        return 1.0, "unit"
+        weight = np.where(
+            has_per_unit,
+            1.0,
+            np.where(has_package, package_weight, 1.0),
+        )
+        unit = np.where(
+            has_per_unit,
+            per_unit.map(self.UNIT_KINDS).fillna("kg").to_numpy(),
+            np.where(
+                has_package,
+                package_unit.map(self.UNIT_KINDS).fillna("kg").to_numpy(),
+                "unit",
+            ),
+        )
 
-    def _clean_product_name(self, text: str) -> str:
-        """Clean product name by removing weights, units, and extra text.
+        return pd.DataFrame(
+            {
+                "is_per_unit": has_per_unit,
+                "product_weight": weight,
+                "product_unit": unit,
+            },
+            index=text.index,
+        )
+
+    def _clean_product_name(self, text: pd.Series) -> pd.Series:
+        """Clean product names by removing weights, units, and extra text.
 
         Removes:
         - Weight and unit information
@@ -391,27 +618,24 @@ class StatCanJSONProcessor:
         - Extra whitespace
 
         Args:
-            text: Raw product name with extraneous information
+            text: Series of raw product names with extraneous information
 
         Returns:
-            Cleaned product name in title case
+            Series of cleaned product names in title case
         """
-        # Remove "per X" phrases
-        text = re.sub(self.PER_EXPR, "", text, flags=re.IGNORECASE)
-
-        # Remove weights, quantities, units
-        text = self.clean_regex.sub("", text)
-
-        # Remove parentheses and contents
-        text = re.sub(r"\(.*?\)", "", text)
-
-        # Remove special characters except spaces
-        text = re.sub(r"[^\w\s]", "", text)
-
-        # Normalize whitespace
-        text = re.sub(r"\s{2,}", " ", text)
-
-        return text.strip().title()
+        return (
+            text
+            # Remove "per X" phrases first, since they run to the end of
+            # the text and may contain parentheses or punctuation
+            .str.replace(self.per_regex, "", regex=True)
+            # Remove weights, quantities, units, parentheses and contents,
+            # and special characters except spaces
+            .str.replace(self.clean_regex, "", regex=True)
+            # Normalize whitespace
+            .str.replace(self.whitespace_regex, " ", regex=True)
+            .str.strip()
+            .str.title()
+        )
 
     def _infer_category(self, name: str) -> str:
         """Infer product category from product name using word-boundary matching.
@@ -420,49 +644,71 @@ class StatCanJSONProcessor:
         category or "other" if no keyword matches.
         """
         name_lower = name.lower()
+        best_priority, best_category = len(self.CATEGORY_KEYWORDS), "other"
+
+        for end, (priority, category, length) in self.category_automaton.iter(
+            name_lower
+        ):
+            if priority >= best_priority:
+                continue
+            # Only accept whole-word hits, like \b...\b
+            start = end - length + 1
+            if start > 0 and self._is_word_char(name_lower[start - 1]):
+                continue
+            if end + 1 < len(name_lower) and self._is_word_char(
+                name_lower[end + 1]
+            ):
+                continue
+            best_priority, best_category = priority, category
+            if priority == 0:
+                break
 
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            for keyword in keywords:
-                pattern = rf"\b{re.escape(keyword)}\b"
-                if re.search(pattern, name_lower):
-                    return category
+        return best_category
 
-        return "other"
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        """Return True if char counts as a word character for \\b."""
+        return char.isalnum() or char == "_"
 
-    def _parse_location(self, location: str) -> Tuple[str, str]:
-        """Parse location into city and province.
+    def _parse_location(self, location: pd.Series) -> pd.DataFrame:
+        """Parse locations into city and province.
 
         Handles formats like:
         - "Canada" → ("", "Canada")
         - "Toronto, Ontario" → ("Toronto", "Ontario")
 
         Args:
-            location: Location string to parse
+            location: Series of location strings to parse
 
         Returns:
-            Tuple of (city, province)
+            DataFrame with city and province columns
         """
-        parts = [p.strip() for p in location.split(",")]
-
-        if len(parts) >= 2:
-            return parts[0], parts[1]
+        # Capture the first two comma-separated parts in one sweep;
+        # rows without a comma come back as NaN
+        parts = location.str.extract(r"^([^,]*),([^,]*)", expand=True)
+        has_city = parts[1].notna()
 
         # If no comma, treat as province/country only
-        return "", location
+        city = parts[0].str.strip().where(has_city, "")
+        province = parts[1].str.strip().where(has_city, location)
 
-    def print_summary(
-        self, df: pd.DataFrame, json_data: Dict
-    ) -> None:
+        return pd.DataFrame(
+            {"city": city, "province": province}, index=location.index
+        )
+
+    def print_summary(self, json_data: Dict) -> None:
         """Print summary statistics of processed data.
 
         Args:
-            df: Transformed DataFrame
             json_data: JSON structure with metadata
         """
         print("\n" + "=" * 60)
         print("PROCESSING SUMMARY")
         print("=" * 60)
-        print(f"Total price records: {len(df)}")
+        print(
+            f"Total price records: "
+            f"{json_data['metadata']['total_records']}"
+        )
         date_range = json_data["metadata"]["date_range"]
         print(f"Date range: {date_range['min']} to {date_range['max']}")
         print(